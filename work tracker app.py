@@ -1,13 +1,34 @@
 from pathlib import Path
+import atexit
+import collections
+import functools
+import importlib.util
 import logging
+import logging.handlers
 import sys
 import os
 import subprocess
-from datetime import datetime, timedelta
-
-import pandas as pd
-from openpyxl import Workbook
-from openpyxl.utils.dataframe import dataframe_to_rows
+from datetime import datetime
+from itertools import chain, islice, zip_longest
+
+def lazy_import(name):
+    """Return module `name`, deferring its actual import until an attribute is first used."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# pandas is the slowest import here and is not needed until a log is loaded or generated.
+pd = lazy_import("pandas")
+
+import numpy as np
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 
 from PyQt5 import QtCore, QtGui, QtWidgets
@@ -15,10 +36,10 @@ from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
     QLabel, QPushButton, QLineEdit, QDateEdit, QDoubleSpinBox, QSpinBox,
     QFileDialog, QMessageBox, QFrame, QGroupBox, QFormLayout, QTabWidget,
-    QListWidget, QTableWidget, QTableWidgetItem, QScrollArea, QSplitter,
-    QSpacerItem, QSizePolicy
+    QListWidget, QTableWidget, QTableWidgetItem, QTableView, QScrollArea, QSplitter,
+    QSpacerItem, QSizePolicy, QProgressBar, QStyledItemDelegate, QHeaderView
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 
 # ----------------- Logging Setup -----------------
 def setup_logging():
@@ -35,7 +56,12 @@ def setup_logging():
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(formatter)
     stream_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # Buffer file records so each log call is not a write() + flush(); errors flush immediately.
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=8192, flushLevel=logging.ERROR, target=file_handler
+    )
+    atexit.register(memory_handler.flush)
+    logger.addHandler(memory_handler)
     logger.addHandler(stream_handler)
     logger.info(f"Logging initialized. Log file: {log_path}")
     return logger
@@ -44,7 +70,15 @@ logger = setup_logging()
 
 # ----------------- Clear Cache Function -----------------
 def clear_cache():
-    """Delete the log file to clear the cache."""
+    """Delete the log file and any cached parsed logs to clear the cache."""
+    _load_df.cache_clear()
+    cache = _disk_cache()
+    if cache is not None:
+        try:
+            cache.clear()
+        except Exception as e:
+            logger.error(f"Failed to clear cache: {e}")
+            return False
     log_file = Path.home() / "WorkTrackerLogs" / "tracker.log"
     if log_file.exists():
         try:
@@ -80,7 +114,184 @@ def open_folder(file_path):
     folder = os.path.dirname(file_path)
     open_file(folder)
 
+# Rows per chunk when a log is parsed without pyarrow; keeps peak memory bounded on large files.
+CSV_CHUNKSIZE = 200_000
+
+def _read_csv(file_path, sep=","):
+    # The pyarrow engine parses multi-threaded and, with the pyarrow dtype backend, hands its
+    # Arrow buffers to pandas without a conversion copy. Fall back to the C engine without
+    # pyarrow, or when pyarrow rejects a file the C engine accepts (e.g. a short row); both
+    # pd.errors.ParserError and pyarrow's ArrowInvalid are ValueErrors.
+    try:
+        return pd.read_csv(file_path, sep=sep, engine="pyarrow", dtype_backend="pyarrow")
+    except (ImportError, ValueError):
+        with pd.read_csv(file_path, sep=sep, chunksize=CSV_CHUNKSIZE) as reader:
+            return pd.concat(reader, ignore_index=True)
+
+def _dedup_columns(names):
+    """Rename repeated column names to "name.1", "name.2", ... as read_excel does."""
+    taken = set(names)
+    seen = set()
+    result = []
+    for name in names:
+        if name in seen:
+            i = 1
+            while f"{name}.{i}" in taken:
+                i += 1
+            name = f"{name}.{i}"
+            taken.add(name)
+        seen.add(name)
+        result.append(name)
+    return result
+
+def _read_xlsx(file_path):
+    # calamine parses in Rust; without python-calamine (or on pandas < 2.2) use openpyxl.
+    try:
+        return pd.read_excel(file_path, engine="calamine")
+    except (ImportError, ValueError):
+        pass
+    # Read-only mode streams plain values without building Cell objects or styles.
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        # read_excel reads the first sheet, whichever one was active when the file was saved.
+        rows = wb.worksheets[0].values
+        header = next(rows, ())
+        columns = _dedup_columns([f"Unnamed: {i}" if c is None else c for i, c in enumerate(header)])
+        data = list(rows)
+    finally:
+        wb.close()
+    while data and all(v is None for v in data[-1]):
+        data.pop()
+    return pd.DataFrame(data, columns=columns)
+
+def _parse_work_log(file_path):
+    if file_path.lower().endswith(".txt"):
+        return _read_csv(file_path, sep="\t")
+    elif file_path.lower().endswith(".csv"):
+        return _read_csv(file_path)
+    elif file_path.lower().endswith(".xlsx"):
+        return _read_xlsx(file_path)
+    else:
+        return _read_csv(file_path)
+
+# Parsed logs kept on disk for a week so reopening a file in a later session skips the parse.
+DISK_CACHE_EXPIRE = 7 * 24 * 60 * 60
+
+@functools.lru_cache(maxsize=None)
+def _disk_cache():
+    # diskcache is optional; without it only the in-memory cache below is used.
+    try:
+        import diskcache
+    except ImportError:
+        return None
+    cache_dir = os.path.join(get_base_path(), "Work Tracker", "cache")
+    try:
+        return diskcache.Cache(cache_dir)
+    except OSError as e:
+        # An unwritable base path only costs the cross-session cache, not loading itself.
+        logger.warning(f"Disk cache unavailable at {cache_dir}: {e}")
+        return None
+
+@functools.lru_cache(maxsize=16)
+def _load_df(file_path, mtime_ns, size):
+    # mtime_ns and size are only part of the cache key: an edited file gets re-parsed.
+    cache = _disk_cache()
+    key = f"df::{file_path}::{mtime_ns}::{size}"
+    if cache is not None:
+        try:
+            df = cache.get(key)
+        except Exception as e:
+            # e.g. a pickle written by another pandas/pyarrow version; drop it and re-parse.
+            logger.warning(f"Discarding unreadable cache entry for {file_path}: {e}")
+            df = None
+            try:
+                cache.delete(key)
+            except Exception:
+                pass
+        if df is not None:
+            return df
+    df = _parse_work_log(file_path)
+    if cache is not None:
+        try:
+            cache.set(key, df, expire=DISK_CACHE_EXPIRE)
+        except Exception as e:
+            logger.warning(f"Could not cache {file_path}: {e}")
+    return df
+
+def load_work_log(file_path):
+    """Read a work log file, reusing the parsed DataFrame while the file is unchanged."""
+    file_path = os.path.abspath(file_path)
+    st = os.stat(file_path)
+    # Hand out a copy so edits by the caller never leak into the cached frame.
+    return _load_df(file_path, st.st_mtime_ns, st.st_size).copy()
+
+def write_csv(df, file_path):
+    """Write df to file_path as CSV without the index.
+
+    Through pyarrow the output differs from DataFrame.to_csv in formatting: string cells
+    and the header are always quoted and whole-number floats are written without ".0"
+    (1 rather than 1.0).
+    """
+    # Arrow serializes in C++ across threads. Use pandas' writer without pyarrow, for mixed-type
+    # object columns Arrow cannot convert, and for datetime/timedelta and bool columns, which
+    # Arrow writes with microseconds, as raw integers, or as true/false.
+    if any(dtype.kind in "mMb" for dtype in df.dtypes):
+        df.to_csv(file_path, index=False)
+        return
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pcsv
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (ImportError, TypeError, ValueError):
+        df.to_csv(file_path, index=False)
+        return
+    pcsv.write_csv(table, file_path, pcsv.WriteOptions(quoting_style="needed"))
+
+def coerce_time_columns(df):
+    """Return a copy of df with Hr/Min as floats; blank or non-numeric entries become NaN."""
+    df = df.copy()
+    for col in ("Hr", "Min"):
+        if col in df.columns:
+            # Plain float64: on Arrow-backed columns coerced text becomes NaN rather than null,
+            # which isna() and sum() would not skip.
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+    return df
+
+# ----------------- Excel Styles -----------------
+# Styles are immutable, so one shared instance is assigned to every cell that uses it.
+# Colors are full ARGB so openpyxl does not default the alpha channel to 00.
+TITLE_FONT = Font(name="Calibri", bold=True, size=16, color="FFFFFFFF")
+TITLE_FILL = PatternFill(start_color="FF005A9E", end_color="FF005A9E", fill_type="solid")
+HEADER_FONT = Font(name="Calibri", bold=True, size=12, color="FFFFFFFF")
+HEADER_FILL = PatternFill(start_color="FF007ACC", end_color="FF007ACC", fill_type="solid")
+HIGHLIGHT_FILL = PatternFill(start_color="FFFFD966", end_color="FFFFD966", fill_type="solid")
+HIGHLIGHT_FONT = Font(name="Calibri", bold=True, size=12, color="FF000000")
+LABEL_FONT = Font(name="Calibri", bold=True, size=12)
+LABEL_FILL = PatternFill(start_color="FFF2F2F2", end_color="FFF2F2F2", fill_type="solid")
+THIN_BORDER = Border(
+    left=Side(style="thin", color="FF000000"),
+    right=Side(style="thin", color="FF000000"),
+    top=Side(style="thin", color="FF000000"),
+    bottom=Side(style="thin", color="FF000000")
+)
+EVEN_ROW_FILL = PatternFill(start_color="FFF9F9F9", end_color="FFF9F9F9", fill_type="solid")
+ODD_ROW_FILL = PatternFill(start_color="FFFFFFFF", end_color="FFFFFFFF", fill_type="solid")
+CENTER_ALIGN = Alignment(horizontal="center", vertical="center")
+LEFT_ALIGN = Alignment(horizontal="left", vertical="center")
+RIGHT_ALIGN = Alignment(horizontal="right")
+
+def _styled_cell(ws, value, fill, alignment):
+    cell = WriteOnlyCell(ws, value=value)
+    cell.border = THIN_BORDER
+    cell.fill = fill
+    cell.alignment = alignment
+    return cell
+
 # ----------------- Excel Workbook Generation -----------------
+# Generated daily sheets span columns A:H and the Total sheet A:E.
+DAILY_SHEET_COLUMNS = 8
+TOTAL_SHEET_COLUMNS = 5
+
 def generate_workbook(data, start_date, end_date, cutoff_days, hourly_rate, employee_name):
     """
     Generates an Excel workbook with the following layout:
@@ -97,28 +308,14 @@ def generate_workbook(data, start_date, end_date, cutoff_days, hourly_rate, empl
     A final "Total" sheet summarizes overall hours and total cost.
     """
     desired_cols = ["Number", "Daily Work Description", "Hr", "Min", "Complete", "Follow up", "Supervisor Comments"]
-    df = data.copy()
-    existing_cols = [c for c in desired_cols if c in df.columns]
-    df = df[existing_cols]
+    existing_cols = [c for c in desired_cols if c in data.columns]
+    df = coerce_time_columns(data[existing_cols])
 
     wb = Workbook()
     default_sheet = wb.active
     wb.remove(default_sheet)
-
-    # Styles
-    title_font = Font(name="Calibri", bold=True, size=16, color="FFFFFF")
-    title_fill = PatternFill(start_color="005A9E", end_color="005A9E", fill_type="solid")
-    header_font = Font(name="Calibri", bold=True, size=12, color="FFFFFF")
-    header_fill = PatternFill(start_color="007ACC", end_color="007ACC", fill_type="solid")
-    highlight_fill = PatternFill(start_color="FFD966", end_color="FFD966", fill_type="solid")
-    highlight_font = Font(name="Calibri", bold=True, size=12, color="000000")
-    label_fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-    thin_border = Border(
-        left=Side(style="thin", color="000000"),
-        right=Side(style="thin", color="000000"),
-        top=Side(style="thin", color="000000"),
-        bottom=Side(style="thin", color="000000")
-    )
+    # (sheet title, hours) per daily sheet, so exports need not read cells back.
+    wb.segment_hours = []
 
     def format_daily_columns(ws):
         ws.column_dimensions["A"].width = 12   # "Date" label
@@ -129,6 +326,9 @@ def generate_workbook(data, start_date, end_date, cutoff_days, hourly_rate, empl
         ws.column_dimensions["F"].width = 12
         ws.column_dimensions["G"].width = 15
         ws.column_dimensions["H"].width = 60   # Supervisor Comments (wider)
+        # Data rows share one height, set once on the sheet instead of a RowDimension per row.
+        ws.sheet_format.defaultRowHeight = 20
+        ws.sheet_format.customHeight = True
 
     def add_daily_header(ws, seg, office="LA Office", employee=employee_name, department="Sales"):
         ws["A1"].value = "Date"
@@ -136,9 +336,9 @@ def generate_workbook(data, start_date, end_date, cutoff_days, hourly_rate, empl
 
         ws.merge_cells("A2:H2")
         ws["A2"].value = f"Daily Recap ( - {office} )"
-        ws["A2"].font = title_font
-        ws["A2"].fill = title_fill
-        ws["A2"].alignment = Alignment(horizontal="center", vertical="center")
+        ws["A2"].font = TITLE_FONT
+        ws["A2"].fill = TITLE_FILL
+        ws["A2"].alignment = CENTER_ALIGN
         ws.row_dimensions[2].height = 30
 
         ws["A3"].value = "Date"
@@ -161,22 +361,36 @@ def generate_workbook(data, start_date, end_date, cutoff_days, hourly_rate, empl
         for col_idx, header_val in enumerate(headers, start=1):
             cell = ws.cell(row=7, column=col_idx)
             cell.value = header_val
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            cell.border = thin_border
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = CENTER_ALIGN
+            cell.border = THIN_BORDER
         ws.row_dimensions[7].height = 26
 
         ws.freeze_panes = "A8"
 
-    segments = []
-    current = start_date
-    while current <= end_date:
-        seg_end = current + timedelta(days=cutoff_days - 1)
-        if seg_end > end_date:
-            seg_end = end_date
-        segments.append((current, seg_end))
-        current = seg_end + timedelta(days=1)
+    # Segment starts every `cutoff_days`; the last segment is clipped to end_date.
+    last_day = pd.Timestamp(end_date)
+    seg_starts = pd.date_range(start_date, last_day, freq=f"{cutoff_days}D")
+    seg_ends = seg_starts + pd.Timedelta(days=cutoff_days - 1)
+    seg_ends = seg_ends.where(seg_ends <= last_day, last_day)
+    segments = list(zip(seg_starts.date, seg_ends.date))
+
+    if df.empty:
+        # Empty template: each sheet gets only its header block.
+        seg_hours = 0.0
+        rows, blank_rows = [], []
+    else:
+        # Every segment holds the same rows, so the hours are summed once from the
+        # DataFrame instead of being read back from the written cells.
+        hr = df["Hr"].sum() if "Hr" in df.columns else 0.0
+        mn = df["Min"].sum() if "Min" in df.columns else 0.0
+        seg_hours = float(hr + mn / 60.0)
+        # The rows are identical for every segment, so materialize them a single time
+        # as plain Python values, with missing entries as None so they write as empty cells.
+        missing = df.isna()
+        rows = df.astype(object).mask(missing, None).to_numpy().tolist()
+        blank_rows = missing.all(axis=1).to_numpy()
 
     grand_total_hours = 0.0
     for seg in segments:
@@ -185,32 +399,20 @@ def generate_workbook(data, start_date, end_date, cutoff_days, hourly_rate, empl
         format_daily_columns(ws)
         add_daily_header(ws, seg)
         start_row = 8
-        for row_vals in dataframe_to_rows(df, index=False, header=False):
-            ws.append(row_vals)
-        for r in range(start_row, ws.max_row + 1):
-            ws.row_dimensions[r].height = 20
-            fill_color = "F9F9F9" if r % 2 == 0 else "FFFFFF"
-            row_fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
-            for c in range(1, 9):
-                cell = ws.cell(row=r, column=c)
-                cell.border = thin_border
-                cell.fill = row_fill
-                if c == 3 or c == 8:
-                    cell.alignment = Alignment(horizontal="left", vertical="center")
-                else:
-                    cell.alignment = Alignment(horizontal="center", vertical="center")
-        seg_hours = 0.0
-        for r in range(start_row, ws.max_row + 1):
-            try:
-                hr_val = float(ws.cell(row=r, column=3).value or 0)
-            except:
-                hr_val = 0
-            try:
-                min_val = float(ws.cell(row=r, column=4).value or 0)
-            except:
-                min_val = 0
-            seg_hours += hr_val + (min_val / 60.0)
         ws["E3"].value = seg_hours
+        # Single pass: each data row is appended with its styles already attached.
+        for r, row_vals in enumerate(rows, start=start_row):
+            if blank_rows[r - start_row]:
+                # Rows with no values keep their place but skip the 8 style assignments.
+                ws.append([])
+                continue
+            row_fill = EVEN_ROW_FILL if r % 2 == 0 else ODD_ROW_FILL
+            # Columns past the DataFrame's last one are padded with styled blanks up to H.
+            ws.append([
+                _styled_cell(ws, val, row_fill, LEFT_ALIGN if c in (3, 8) else CENTER_ALIGN)
+                for c, val in zip_longest(range(1, DAILY_SHEET_COLUMNS + 1), row_vals)
+            ])
+        wb.segment_hours.append((sheet_name, seg_hours))
         grand_total_hours += seg_hours
 
     ws_total = wb.create_sheet(title="Total")
@@ -222,9 +424,9 @@ def generate_workbook(data, start_date, end_date, cutoff_days, hourly_rate, empl
 
     ws_total.merge_cells("B1:E1")
     ws_total["B1"].value = "Summary of All Sheets"
-    ws_total["B1"].font = title_font
-    ws_total["B1"].fill = title_fill
-    ws_total["B1"].alignment = Alignment(horizontal="center", vertical="center")
+    ws_total["B1"].font = TITLE_FONT
+    ws_total["B1"].fill = TITLE_FILL
+    ws_total["B1"].alignment = CENTER_ALIGN
     ws_total.row_dimensions[1].height = 30
     ws_total.freeze_panes = "B3"
 
@@ -240,25 +442,25 @@ def generate_workbook(data, start_date, end_date, cutoff_days, hourly_rate, empl
     for label, val in summary_data:
         cell_label = ws_total.cell(row=row_idx, column=2)
         cell_label.value = label
-        cell_label.font = Font(name="Calibri", bold=True, size=12)
-        cell_label.alignment = Alignment(horizontal="right")
-        cell_label.fill = label_fill
-        cell_label.border = thin_border
+        cell_label.font = LABEL_FONT
+        cell_label.alignment = RIGHT_ALIGN
+        cell_label.fill = LABEL_FILL
+        cell_label.border = THIN_BORDER
 
         cell_val = ws_total.cell(row=row_idx, column=3)
         cell_val.value = val
-        cell_val.border = thin_border
-        cell_val.alignment = Alignment(horizontal="center", vertical="center")
+        cell_val.border = THIN_BORDER
+        cell_val.alignment = CENTER_ALIGN
+        if label == "Total (Rate * Hours)":
+            cell_val.fill = HIGHLIGHT_FILL
+            cell_val.font = HIGHLIGHT_FONT
         ws_total.row_dimensions[row_idx].height = 24
         row_idx += 1
 
-    ws_total["C5"].fill = highlight_fill
-    ws_total["C5"].font = highlight_font
-
     return wb
 
 def export_to_pdf(workbook, pdf_path):
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib import colors
     from reportlab.lib.pagesizes import LETTER
@@ -295,16 +497,17 @@ def export_to_pdf(workbook, pdf_path):
     ]))
     elements.extend([Paragraph("Overall Summary", styles["Heading2"]), Spacer(1, 6), overall_table, Spacer(1, 24)])
 
+    segment_hours = getattr(workbook, "segment_hours", None)
+    if segment_hours is None:
+        segment_hours = (
+            (sheet.title, float(sheet["E3"].value or 0))
+            for sheet in workbook.worksheets if sheet.title != "Total"
+        )
     sheet_data = [["Sheet Name", "Hours Rendered"]]
-    for sheet in workbook.worksheets:
-        if sheet.title == "Total":
-            continue
-        try:
-            hours = float(sheet["E3"].value or 0)
-        except:
-            hours = 0
-        sheet_data.append([sheet.title, str(hours)])
-    sheet_table = Table(sheet_data, colWidths=[250, 100])
+    sheet_data.extend([title, str(hours)] for title, hours in segment_hours)
+    # LongTable sizes columns from the first rows only, which keeps very long breakdowns cheap.
+    table_cls = LongTable if len(sheet_data) > 500 else Table
+    sheet_table = table_cls(sheet_data, colWidths=[250, 100], repeatRows=1)
     sheet_table_style = TableStyle([
         ("BACKGROUND", (0,0), (-1,0), colors.HexColor("#007ACC")),
         ("TEXTCOLOR", (0,0), (-1,0), colors.whitesmoke),
@@ -323,8 +526,89 @@ def export_to_pdf(workbook, pdf_path):
     doc.build(elements)
     return pdf_path
 
+# ----------------- Background Tasks -----------------
+class WorkerSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(object)
+
+class Worker(QRunnable):
+    """Runs fn(*args) on a QThreadPool thread and reports the result through signals."""
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+# ----------------- Preview Model -----------------
+def iter_sheet_values(sheet, max_col, min_row=1, max_row=None):
+    """Yield row value tuples like sheet.iter_rows(max_col=max_col, values_only=True).
+
+    iter_rows goes through sheet.cell(), which creates (and keeps) a Cell object for
+    every empty coordinate it visits; this reads the existing cells and leaves gaps as None.
+    The width is passed in because sheet.max_column scans every stored cell. Without
+    max_row it runs to the last written row, taken from the row counter openpyxl keeps as
+    cells are added rather than from sheet.max_row, which scans every cell too.
+    """
+    cells = sheet._cells
+    columns = range(1, max_col + 1)
+    if max_row is None:
+        max_row = sheet._current_row
+    for r in range(min_row, max_row + 1):
+        yield tuple(cells[(r, c)].value if (r, c) in cells else None for c in columns)
+
+def _stringify(row):
+    """Return row's values as display strings, with None shown as an empty cell."""
+    return ["" if c is None else str(c) for c in row]
+
+class SheetModel(QAbstractTableModel):
+    """Read-only model over preview rows; the view only asks for the cells it paints."""
+    def __init__(self, headers, rows, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows = rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+class HighlightDelegate(QStyledItemDelegate):
+    """Paints a yellow background behind cells whose text contains `term` (lowercase)."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.term = ""
+
+    def paint(self, painter, option, index):
+        if self.term:
+            text = index.data()
+            if text is not None and self.term in str(text).lower():
+                painter.fillRect(option.rect, QtGui.QColor("yellow"))
+        super().paint(painter, option, index)
+
 # ----------------- PyQt5 GUI Application -----------------
 class TrackerApp(QMainWindow):
+    # Oldest export-history entries are dropped beyond this many.
+    EXPORT_HISTORY_LIMIT = 200
+
     def __init__(self):
         super().__init__()
         self.logger = logging.getLogger(__name__)
@@ -332,7 +616,19 @@ class TrackerApp(QMainWindow):
         self.resize(1200, 800)
         self.df = None
         self.workbook = None
-        self.export_history = []
+        self.export_history = collections.deque(maxlen=self.EXPORT_HISTORY_LIMIT)
+        self.thread_pool = QThreadPool.globalInstance()
+        export_root = os.path.join(get_base_path(), "Work Tracker")
+        self.xlsx_dir = os.path.join(export_root, "XLSX")
+        self.pdf_dir = os.path.join(export_root, "PDF")
+        self.csv_dir = os.path.join(export_root, "CSV")
+        for export_dir in (self.xlsx_dir, self.pdf_dir, self.csv_dir):
+            # A read-only base path (e.g. a frozen exe under Program Files) must not stop the app
+            # from starting; the save dialogs still let the user pick another folder.
+            try:
+                os.makedirs(export_dir, exist_ok=True)
+            except OSError as e:
+                self.logger.warning(f"Could not create export folder {export_dir}: {e}")
         self.setup_ui()
 
     def setup_ui(self):
@@ -436,7 +732,15 @@ class TrackerApp(QMainWindow):
 
         # Right Panel
         self.right_frame = QFrame()
-        self.right_frame.setStyleSheet("QFrame { background-color: #FFFDFB; border: 1px solid #D8D2CA; border-radius: 8px; }")
+        # Table styling for every tab lives here so it is parsed once, not per table. It can't go on
+        # the QApplication: this frame's QFrame rule would win over it, QTableView being a QFrame.
+        # QTableView selectors also match QTableWidget.
+        self.right_frame.setStyleSheet("""
+            QFrame { background-color: #FFFDFB; border: 1px solid #D8D2CA; border-radius: 8px; }
+            QTableView { background-color: #FFFFFF; }
+            QTableView::item { padding: 4px; }
+            QTableView::item:selected { background-color: #ADD8E6; }
+        """)
         right_layout = QVBoxLayout(self.right_frame)
         right_layout.setContentsMargins(10, 10, 10, 10)
         right_layout.setSpacing(12)
@@ -451,7 +755,18 @@ class TrackerApp(QMainWindow):
         top_right_layout.addWidget(preview_title)
         self.tab_filter_edit = QLineEdit()
         self.tab_filter_edit.setPlaceholderText("Enter tab date (MM-DD-YYYY) to jump")
-        self.tab_filter_edit.textChanged.connect(self.filter_tabs)
+        # Coalesce keystrokes: the jump runs once typing pauses for 100 ms.
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(100)
+        self.filter_timer.timeout.connect(self.filter_tabs)
+        self.tab_filter_edit.textChanged.connect(lambda _text: self.filter_timer.start())
+        # Search highlighting is debounced the same way, once typing pauses for 150 ms.
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.search_in_preview)
+        self.tab_filter_edit.textChanged.connect(lambda _text: self.search_timer.start())
         top_right_layout.addWidget(self.tab_filter_edit)
         right_layout.addWidget(top_right)
 
@@ -467,16 +782,13 @@ class TrackerApp(QMainWindow):
         self.raw_data_table = QTableWidget()
         self.raw_data_table.verticalHeader().setVisible(False)
         self.raw_data_table.setAlternatingRowColors(True)
-        self.raw_data_table.setStyleSheet("""
-            QTableWidget { background-color: #FFFFFF; }
-            QTableWidget::item { padding: 4px; }
-            QTableWidget::item:selected { background-color: #ADD8E6; }
-        """)
+        self.raw_data_table.setItemDelegate(HighlightDelegate(self.raw_data_table))
         scroll_raw = QScrollArea()
         scroll_raw.setWidgetResizable(True)
         scroll_raw.setWidget(self.raw_data_table)
         self.raw_data_layout.addWidget(scroll_raw)
         self.tabs.addTab(self.raw_data_tab, "Raw Data")
+        self.tab_names_lower = ["raw data"]
         right_layout.addWidget(self.tabs)
 
         # Bottom: Generation Parameters + Export Buttons
@@ -511,41 +823,47 @@ class TrackerApp(QMainWindow):
         self.user_name_edit2.setPlaceholderText("Enter Employee Name")
         gen_params_layout.addRow("Employee Name:", self.user_name_edit2)
 
-        generate_btn = QPushButton("Generate XLSX")
-        generate_btn.setStyleSheet("""
+        self.generate_btn = QPushButton("Generate XLSX")
+        self.generate_btn.setStyleSheet("""
             QPushButton { background-color: #333333; color: white; font-size: 14pt; padding: 10px; }
             QPushButton:hover { background-color: #555555; }
         """)
-        generate_btn.clicked.connect(self.generate_spreadsheet)
-        gen_params_layout.addRow(generate_btn)
+        self.generate_btn.clicked.connect(self.generate_spreadsheet)
+        gen_params_layout.addRow(self.generate_btn)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)  # indeterminate while a background task runs
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.hide()
+        gen_params_layout.addRow(self.progress_bar)
 
         export_buttons_layout = QHBoxLayout()
         export_btn_style = """
             QPushButton { background-color: black; color: white; padding: 6px; text-transform: uppercase; }
             QPushButton:hover { background-color: #666666; }
         """
-        export_excel_btn = QPushButton("Export Excel")
-        export_excel_btn.setStyleSheet(export_btn_style)
-        export_excel_btn.clicked.connect(self.export_as_excel)
-        export_pdf_btn = QPushButton("Export PDF")
-        export_pdf_btn.setStyleSheet(export_btn_style)
-        export_pdf_btn.clicked.connect(self.export_as_pdf)
-        export_csv_btn = QPushButton("Export CSV")
-        export_csv_btn.setStyleSheet(export_btn_style)
-        export_csv_btn.clicked.connect(self.export_as_csv)
+        self.export_excel_btn = QPushButton("Export Excel")
+        self.export_excel_btn.setStyleSheet(export_btn_style)
+        self.export_excel_btn.clicked.connect(self.export_as_excel)
+        self.export_pdf_btn = QPushButton("Export PDF")
+        self.export_pdf_btn.setStyleSheet(export_btn_style)
+        self.export_pdf_btn.clicked.connect(self.export_as_pdf)
+        self.export_csv_btn = QPushButton("Export CSV")
+        self.export_csv_btn.setStyleSheet(export_btn_style)
+        self.export_csv_btn.clicked.connect(self.export_as_csv)
         export_buttons_layout.setSpacing(10)
-        export_buttons_layout.addWidget(export_excel_btn)
-        export_buttons_layout.addWidget(export_pdf_btn)
-        export_buttons_layout.addWidget(export_csv_btn)
+        export_buttons_layout.addWidget(self.export_excel_btn)
+        export_buttons_layout.addWidget(self.export_pdf_btn)
+        export_buttons_layout.addWidget(self.export_csv_btn)
         gen_params_layout.addRow(export_buttons_layout)
 
-        explore_btn = QPushButton("Explore New Sheet")
-        explore_btn.setStyleSheet("""
+        self.explore_btn = QPushButton("Explore New Sheet")
+        self.explore_btn.setStyleSheet("""
             QPushButton { background-color: darkgray; color: white; padding: 8px; font-weight: bold; }
             QPushButton:hover { background-color: #aaaaaa; }
         """)
-        explore_btn.clicked.connect(self.explore_new_sheet)
-        gen_params_layout.addRow(explore_btn)
+        self.explore_btn.clicked.connect(self.explore_new_sheet)
+        gen_params_layout.addRow(self.explore_btn)
 
         scroll_gen = QScrollArea()
         scroll_gen.setWidgetResizable(True)
@@ -589,14 +907,7 @@ class TrackerApp(QMainWindow):
             QMessageBox.critical(self, "Error", "Please select a valid file.")
             return
         try:
-            if file_path.lower().endswith(".txt"):
-                df = pd.read_csv(file_path, sep="\t")
-            elif file_path.lower().endswith(".csv"):
-                df = pd.read_csv(file_path)
-            elif file_path.lower().endswith(".xlsx"):
-                df = pd.read_excel(file_path)
-            else:
-                df = pd.read_csv(file_path)
+            df = load_work_log(file_path)
             self.df = df
             preview_df = df.head(30)
             self.populate_tablewidget(self.raw_data_table, preview_df)
@@ -605,22 +916,37 @@ class TrackerApp(QMainWindow):
             self.logger.error(f"Failed to preview file: {e}")
             QMessageBox.critical(self, "Error", f"Failed to preview file:\n{e}")
 
-    def populate_tablewidget(self, table: QTableWidget, df: pd.DataFrame):
-        table.clear()
-        table.setRowCount(len(df))
-        table.setColumnCount(len(df.columns))
-        table.setHorizontalHeaderLabels([str(c) for c in df.columns])
-        for i in range(len(df)):
-            for j in range(len(df.columns)):
-                table.setItem(i, j, QTableWidgetItem(str(df.iat[i, j])))
-        table.resizeColumnsToContents()
-        table.resizeRowsToContents()
+    def populate_tablewidget(self, table: QTableWidget, df: "pd.DataFrame"):
+        # Suppress repaints and item signals while filling so the view lays out once.
+        # Missing cells (NaN, or <NA> from Arrow-backed columns) show as blank.
+        values = df.astype(object).where(df.notna(), "").to_numpy()
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setSortingEnabled(False)
+        # Interactive sections are not re-measured by the header as each item lands.
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        try:
+            table.clear()
+            table.setRowCount(len(df))
+            table.setColumnCount(len(df.columns))
+            table.setHorizontalHeaderLabels([str(c) for c in df.columns])
+            for (i, j), value in np.ndenumerate(values):
+                table.setItem(i, j, QTableWidgetItem(str(value)))
+            table.resizeColumnsToContents()
+            # Fixed row height instead of resizeRowsToContents(), which measures every cell.
+            table.verticalHeader().setDefaultSectionSize(22)
+        finally:
+            table.setSortingEnabled(sorting)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
     def filter_tabs(self):
         text = self.tab_filter_edit.text().strip().lower()
-        for i in range(self.tabs.count()):
-            tab_name = self.tabs.tabText(i).lower()
-            if text in tab_name:
+        if not text:
+            return
+        for i, tab_name in enumerate(self.tab_names_lower):
+            if tab_name.startswith(text):
                 self.tabs.setCurrentIndex(i)
                 return
 
@@ -650,21 +976,47 @@ class TrackerApp(QMainWindow):
             QMessageBox.warning(self, "Input Required", "Please enter an employee name.")
             return
 
-        try:
-            new_wb = generate_workbook(self.df, start_date, end_date, cutoff_days, hourly_rate, employee_name)
-            self.workbook = new_wb
-            self.logger.info("Spreadsheet generated in memory.")
-        except Exception as e:
-            self.logger.error(f"Failed to generate spreadsheet: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to generate spreadsheet:\n{e}")
-            return
+        self.run_task(
+            generate_workbook, self.df, start_date, end_date, cutoff_days, hourly_rate, employee_name,
+            on_done=self.workbook_generated, on_error=self.workbook_failed
+        )
 
+    def workbook_generated(self, new_wb):
+        self.workbook = new_wb
+        self.logger.info("Spreadsheet generated in memory.")
         self.populate_preview_tabs()
         QMessageBox.information(self, "Success", "Spreadsheet generated in memory.\nYou can now export it.")
 
+    def workbook_failed(self, e):
+        self.logger.error(f"Failed to generate spreadsheet: {e}")
+        QMessageBox.critical(self, "Error", f"Failed to generate spreadsheet:\n{e}")
+
+    def run_task(self, fn, *args, on_done, on_error):
+        # Long-running work goes to the thread pool; the buttons stay disabled until it reports back.
+        # pandas is imported lazily and LazyLoader is not thread-safe before Python 3.12.3, so
+        # finish loading it here on the GUI thread before a worker can be first to touch it.
+        pd.DataFrame
+        worker = Worker(fn, *args)
+        worker.signals.finished.connect(self.end_task)
+        worker.signals.error.connect(self.end_task)
+        worker.signals.finished.connect(on_done)
+        worker.signals.error.connect(on_error)
+        self.set_busy(True)
+        self.thread_pool.start(worker)
+
+    def end_task(self, _result=None):
+        self.set_busy(False)
+
+    def set_busy(self, busy):
+        for btn in (self.generate_btn, self.export_excel_btn, self.export_pdf_btn,
+                    self.export_csv_btn, self.explore_btn):
+            btn.setEnabled(not busy)
+        self.progress_bar.setVisible(busy)
+
     def populate_preview_tabs(self):
         while self.tabs.count() > 1:
             self.tabs.removeTab(self.tabs.count() - 1)
+        del self.tab_names_lower[1:]
         if not self.workbook:
             return
         for sheet in self.workbook.worksheets:
@@ -672,31 +1024,26 @@ class TrackerApp(QMainWindow):
                 continue
             tab = QWidget()
             layout = QVBoxLayout(tab)
-            table = QTableWidget()
-            table.verticalHeader().setVisible(False)
-            table.setAlternatingRowColors(True)
-            table.setStyleSheet("""
-                QTableWidget { background-color: #FFFFFF; }
-                QTableWidget::item { padding: 4px; }
-                QTableWidget::item:selected { background-color: #ADD8E6; }
-            """)
-            layout.addWidget(table)
+            view = QTableView()
+            view.verticalHeader().setVisible(False)
+            view.setAlternatingRowColors(True)
+            view.setItemDelegate(HighlightDelegate(view))
+            layout.addWidget(view)
             self.tabs.addTab(tab, sheet.title)
-            data_list = []
-            headers = []
-            for row in sheet.iter_rows(min_row=1, max_row=1, values_only=True):
-                headers = [str(c) if c is not None else "" for c in row]
-            for row in sheet.iter_rows(min_row=1, max_row=min(sheet.max_row, 20), values_only=True):
-                row_vals = [str(c) if c is not None else "" for c in row]
-                data_list.append(row_vals)
-            table.setRowCount(len(data_list))
-            table.setColumnCount(len(headers))
-            table.setHorizontalHeaderLabels(headers)
-            for i in range(len(data_list)):
-                for j in range(len(headers)):
-                    table.setItem(i, j, QTableWidgetItem(data_list[i][j]))
-            table.resizeColumnsToContents()
-            table.resizeRowsToContents()
+            self.tab_names_lower.append(sheet.title.lower())
+            # One pass over the sheet: row 1 supplies the headers and is also the first preview row.
+            max_col = TOTAL_SHEET_COLUMNS if sheet.title == "Total" else DAILY_SHEET_COLUMNS
+            rows_iter = iter_sheet_values(sheet, max_col, min_row=1)
+            first = next(rows_iter, None)
+            headers = _stringify(first) if first else []
+            rows = [_stringify(row) for row in chain([first], islice(rows_iter, 19))] if first else []
+            view.setModel(SheetModel(headers, rows, view))
+            # Size columns once from the preview rows and use a fixed row height,
+            # rather than measuring every row's text.
+            header = view.horizontalHeader()
+            header.setSectionResizeMode(QHeaderView.Interactive)
+            header.resizeSections(QHeaderView.ResizeToContents)
+            view.verticalHeader().setDefaultSectionSize(22)
 
     def explore_new_sheet(self):
         new_file, _ = QFileDialog.getOpenFileName(
@@ -705,37 +1052,40 @@ class TrackerApp(QMainWindow):
         )
         if not new_file:
             return
-        try:
-            if new_file.lower().endswith(".txt"):
-                new_df = pd.read_csv(new_file, sep="\t")
-            elif new_file.lower().endswith(".csv"):
-                new_df = pd.read_csv(new_file)
-            elif new_file.lower().endswith(".xlsx"):
-                new_df = pd.read_excel(new_file)
-            else:
-                new_df = pd.read_csv(new_file)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load new file:\n{e}")
-            return
+        params = (
+            self.start_date_edit2.date().toPyDate(),
+            self.end_date_edit2.date().toPyDate(),
+            self.cutoff_spin2.value(),
+            self.rate_spin2.value(),
+            self.user_name_edit2.text().strip(),
+        )
+        # Loading and generation both run on the thread pool; the buttons stay disabled throughout.
+        self.run_task(
+            load_work_log, new_file,
+            on_done=lambda new_df: self.explore_file_loaded(new_file, new_df, params),
+            on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to load new file:\n{e}")
+        )
+
+    def explore_file_loaded(self, new_file, new_df, params):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.history_list.addItem(f"{new_file} ({timestamp})")
+        self.run_task(
+            generate_workbook, new_df, *params,
+            on_done=self.explored_sheet_ready,
+            on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to add new sheet:\n{e}")
+        )
 
-        start_date = self.start_date_edit2.date().toPyDate()
-        end_date = self.end_date_edit2.date().toPyDate()
-        cutoff_days = self.cutoff_spin2.value()
-        hourly_rate = self.rate_spin2.value()
-        employee_name = self.user_name_edit2.text().strip()
-
+    def explored_sheet_ready(self, new_wb):
         try:
-            new_wb = generate_workbook(new_df, start_date, end_date, cutoff_days, hourly_rate, employee_name)
             if self.workbook is None:
                 self.workbook = new_wb
             else:
-                for sheet in new_wb.worksheets:
-                    if sheet.title != "Total":
-                        self.workbook._sheets.append(sheet)
-                self.workbook.remove(self.workbook["Total"])
-                self.workbook._sheets.append(new_wb["Total"])
+                # Rebuild the sheet list in one assignment: existing daily sheets, the new
+                # daily sheets, then the new Total replacing the old one.
+                kept = [sheet for sheet in self.workbook._sheets if sheet.title != "Total"]
+                added = [sheet for sheet in new_wb._sheets if sheet.title != "Total"]
+                self.workbook._sheets = kept + added + [new_wb["Total"]]
+                self.workbook.segment_hours.extend(new_wb.segment_hours)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to add new sheet:\n{e}")
             return
@@ -751,6 +1101,7 @@ class TrackerApp(QMainWindow):
         self.workbook = None
         while self.tabs.count() > 1:
             self.tabs.removeTab(self.tabs.count() - 1)
+        del self.tab_names_lower[1:]
         self.export_history_list.clear()
         QMessageBox.information(self, "Refresh", "All inputs have been refreshed.")
 
@@ -760,23 +1111,13 @@ class TrackerApp(QMainWindow):
             QMessageBox.critical(self, "Error", "No spreadsheet generated.")
             return
 
-        base_path = get_base_path()
-        export_dir = os.path.join(base_path, "Work Tracker", "XLSX")
-        os.makedirs(export_dir, exist_ok=True)
-        file_path, _ = QFileDialog.getSaveFileName(self, "Save Excel File", export_dir, "Excel Files (*.xlsx)")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Excel File", self.xlsx_dir, "Excel Files (*.xlsx)")
         if file_path:
-            try:
-                self.workbook.save(file_path)
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.logger.info(f"Excel file saved: {file_path}")
-                self.export_history.append(f"{file_path} ({timestamp})")
-                self.export_history_list.addItem(f"Exported XLSX: {file_path} ({timestamp})")
-                QMessageBox.information(self, "Success", f"Excel file saved at:\n{file_path}")
-                open_file(file_path)
-                open_folder(file_path)
-            except Exception as e:
-                self.logger.error(f"Failed to save Excel file: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to save Excel file:\n{e}")
+            self.run_task(
+                self.workbook.save, file_path,
+                on_done=lambda _: self.export_finished("XLSX", "Excel file", file_path),
+                on_error=lambda e: self.export_failed("Failed to save Excel file", e)
+            )
 
     def export_as_pdf(self):
         if not self.workbook:
@@ -784,23 +1125,13 @@ class TrackerApp(QMainWindow):
             QMessageBox.critical(self, "Error", "No spreadsheet generated.")
             return
 
-        base_path = get_base_path()
-        export_dir = os.path.join(base_path, "Work Tracker", "PDF")
-        os.makedirs(export_dir, exist_ok=True)
-        file_path, _ = QFileDialog.getSaveFileName(self, "Save PDF File", export_dir, "PDF Files (*.pdf)")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save PDF File", self.pdf_dir, "PDF Files (*.pdf)")
         if file_path:
-            try:
-                export_to_pdf(self.workbook, file_path)
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.logger.info(f"PDF file saved: {file_path}")
-                self.export_history.append(f"{file_path} ({timestamp})")
-                self.export_history_list.addItem(f"Exported PDF: {file_path} ({timestamp})")
-                QMessageBox.information(self, "Success", f"PDF file saved at:\n{file_path}")
-                open_file(file_path)
-                open_folder(file_path)
-            except Exception as e:
-                self.logger.error(f"Failed to export PDF: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to export PDF:\n{e}")
+            self.run_task(
+                export_to_pdf, self.workbook, file_path,
+                on_done=lambda _: self.export_finished("PDF", "PDF file", file_path),
+                on_error=lambda e: self.export_failed("Failed to export PDF", e)
+            )
 
     def export_as_csv(self):
         if self.df is None:
@@ -808,40 +1139,39 @@ class TrackerApp(QMainWindow):
             QMessageBox.critical(self, "Error", "No data loaded.")
             return
 
-        base_path = get_base_path()
-        export_dir = os.path.join(base_path, "Work Tracker", "CSV")
-        os.makedirs(export_dir, exist_ok=True)
-        file_path, _ = QFileDialog.getSaveFileName(self, "Save CSV File", export_dir, "CSV Files (*.csv)")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save CSV File", self.csv_dir, "CSV Files (*.csv)")
         if file_path:
-            try:
-                self.df.to_csv(file_path, index=False)
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.logger.info(f"CSV file saved: {file_path}")
-                self.export_history.append(f"{file_path} ({timestamp})")
-                self.export_history_list.addItem(f"Exported CSV: {file_path} ({timestamp})")
-                QMessageBox.information(self, "Success", f"CSV file saved at:\n{file_path}")
-                open_file(file_path)
-                open_folder(file_path)
-            except Exception as e:
-                self.logger.error(f"Failed to export CSV: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to export CSV:\n{e}")
+            self.run_task(
+                write_csv, self.df, file_path,
+                on_done=lambda _: self.export_finished("CSV", "CSV file", file_path),
+                on_error=lambda e: self.export_failed("Failed to export CSV", e)
+            )
+
+    def export_finished(self, kind, description, file_path):
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.logger.info(f"{description} saved: {file_path}")
+        self.export_history.append(f"{file_path} ({timestamp})")
+        self.export_history_list.addItem(f"Exported {kind}: {file_path} ({timestamp})")
+        if self.export_history_list.count() > self.EXPORT_HISTORY_LIMIT:
+            self.export_history_list.takeItem(0)
+        QMessageBox.information(self, "Success", f"{description} saved at:\n{file_path}")
+        open_file(file_path)
+        open_folder(file_path)
+
+    def export_failed(self, message, e):
+        self.logger.error(f"{message}: {e}")
+        QMessageBox.critical(self, "Error", f"{message}:\n{e}")
 
     def search_in_preview(self):
+        # Highlighting happens at paint time in HighlightDelegate, so only visible cells are checked.
         search_term = self.tab_filter_edit.text().lower()
-        if not search_term:
-            return
         current_tab = self.tabs.currentWidget()
         if current_tab is None:
             return
-        table = current_tab.findChild(QTableWidget)
-        if table:
-            for i in range(table.rowCount()):
-                for j in range(table.columnCount()):
-                    item = table.item(i, j)
-                    if item and search_term in item.text().lower():
-                        item.setBackground(QtGui.QColor("yellow"))
-                    else:
-                        item.setBackground(QtGui.QColor("white"))
+        view = current_tab.findChild(QTableView)  # also finds the raw-data QTableWidget
+        if view and isinstance(view.itemDelegate(), HighlightDelegate):
+            view.itemDelegate().term = search_term
+            view.viewport().update()
 
 def main():
     logger = logging.getLogger(__name__)
@@ -851,7 +1181,12 @@ def main():
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(formatter)
     stream_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # Same buffering as setup_logging: batch file writes, but flush at once on errors.
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=8192, flushLevel=logging.ERROR, target=file_handler
+    )
+    atexit.register(memory_handler.flush)
+    logger.addHandler(memory_handler)
     logger.addHandler(stream_handler)
 
     app = QApplication(sys.argv)